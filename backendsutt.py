@@ -1,7 +1,11 @@
 
+import bisect
 import csv
+import io
 import os
-from typing import Dict, List, Optional, Set
+import stat
+import sys
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Optional, Set, Tuple
 
 
 # ----------------------------
@@ -33,35 +37,87 @@ class Room:
         room_no: unique identifier for the room (string).
         building: building/name of location (string).
         capacity: integer capacity.
-        booked_hours: set of ints in 0..23 representing booked hours.
+        mask: 24-bit int bitmap of booked hours (bit h set => booked at hour h).
     """
 
-    def __init__(self, room_no: str, building: str, capacity: int, booked_hours: Optional[Set[int]] = None):
+    def __init__(self, room_no: str, building: str, capacity: int,
+                 booked_hours: Optional[Set[int]] = None, mask: int = 0):
         self.room_no = room_no
-        self.building = building
-        self.capacity = int(capacity)
-        self.booked_hours: Set[int] = set(booked_hours or [])
+        self._building = building
+        self._building_lc = building.lower()
+        self._capacity = int(capacity)
+        self.mask: int = mask
+        for h in booked_hours or ():
+            self.mask |= 1 << h
+        # cached renderings; reset by book_hour and the building/capacity setters
+        self._booked_str: Optional[str] = None
+        self._str_cache: Optional[str] = None
+        # owning RoomManager, told about changes so its indexes and dirty set stay current
+        self._manager: Optional["RoomManager"] = None
+
+    @property
+    def building(self) -> str:
+        return self._building
+
+    @building.setter
+    def building(self, value: str):
+        old_lc = self._building_lc
+        self._building = value
+        self._building_lc = value.lower()
+        self._str_cache = None
+        if self._manager is not None:
+            self._manager._room_changed(self, old_lc)
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @capacity.setter
+    def capacity(self, value: int):
+        self._capacity = int(value)
+        self._str_cache = None
+        if self._manager is not None:
+            self._manager._room_changed(self, self._building_lc)
+
+    @property
+    def booked_hours(self) -> FrozenSet[int]:
+        """Read-only set of booked hours, unpacked from the bitmap; use book_hour to add one."""
+        return frozenset(self.iter_booked_hours())
+
+    def iter_booked_hours(self):
+        """Yield booked hours in ascending order by walking the set bits."""
+        m = self.mask
+        while m:
+            yield (m & -m).bit_length() - 1
+            m &= m - 1
 
     def is_free_at(self, hour: int) -> bool:
         """Return True if the room is free at the given hour."""
-        return hour not in self.booked_hours
+        return not (self.mask >> hour) & 1
 
     def book_hour(self, hour: int):
         """Book the room for the specified hour, raising TimeslotAlreadyBookedError if occupied."""
-        if hour in self.booked_hours:
+        bit = 1 << hour
+        if self.mask & bit:
             raise TimeslotAlreadyBookedError(f"Room {self.room_no} is already booked at hour {hour}.")
-        self.booked_hours.add(hour)
+        self.mask |= bit
+        self._booked_str = None
+        self._str_cache = None
+        if self._manager is not None:
+            self._manager._booked(self)
 
     def booked_hours_str(self) -> str:
         """Return a semicolon-separated string of booked hours (sorted) for CSV storage."""
-        if not self.booked_hours:
-            return ""
-        return ";".join(str(h) for h in sorted(self.booked_hours))
+        if self._booked_str is None:
+            self._booked_str = ";".join(str(h) for h in self.iter_booked_hours())
+        return self._booked_str
 
     def __str__(self) -> str:
-        booked = ", ".join(str(h) for h in sorted(self.booked_hours)) or "No bookings"
-        return (f"Room: {self.room_no} | Building: {self.building} | Capacity: {self.capacity} | "
-                f"Booked hours: {booked}")
+        if self._str_cache is None:
+            booked = ", ".join(str(h) for h in self.iter_booked_hours()) or "No bookings"
+            self._str_cache = (f"Room: {self.room_no} | Building: {self.building} | Capacity: {self.capacity} | "
+                               f"Booked hours: {booked}")
+        return self._str_cache
 
 
 # ----------------------------
@@ -74,10 +130,26 @@ class RoomManager:
 
     CSV_FILENAME = "bookings_final_state.csv"
     CSV_HEADERS = ["room_no", "building", "capacity", "booked_hours"]
+    # canonical hour text -> bit, so parsing a booked hour is a single dict lookup
+    HOUR_CODES: Dict[str, int] = {str(h): 1 << h for h in range(24)}
 
     def __init__(self):
         # rooms keyed by room_no
         self.rooms: Dict[str, Room] = {}
+        # secondary index: lowercased building -> room_nos in that building
+        self._by_building: Dict[str, Set[str]] = {}
+        # structure-of-arrays view of the rooms ordered by capacity, largest first.
+        # Rebuilt lazily after rooms are added; booking updates _soa_masks in place.
+        self._soa_stale = True
+        self._soa_ids: List[str] = []
+        self._soa_neg_caps: List[int] = []
+        self._soa_bld: List[str] = []
+        self._soa_masks: List[int] = []
+        self._soa_pos: Dict[str, int] = {}
+        # room_nos kept in sorted order so list_rooms doesn't re-sort each call
+        self._sorted_room_nos: List[str] = []
+        # room_nos changed since the last load/save; save_to_csv is a no-op while empty
+        self._dirty: Set[str] = set()
         self.load_from_csv()
 
     # Persistence
@@ -87,55 +159,83 @@ class RoomManager:
             # No file yet; start with an empty manager
             return
         try:
-            with open(self.CSV_FILENAME, newline="", encoding="utf-8") as csvfile:
-                reader = csv.DictReader(csvfile)
-                # If headers don't match, ignore file (defensive)
-                if reader.fieldnames is None or any(h not in reader.fieldnames for h in self.CSV_HEADERS):
-                    print(f"Warning: CSV file found but headers don't match expected {self.CSV_HEADERS}. Skipping load.")
-                    return
-                for row in reader:
-                    room_no = (row.get("room_no") or "").strip()
-                    building = (row.get("building") or "").strip()
-                    capacity_str = (row.get("capacity") or "0").strip()
-                    booked_str = (row.get("booked_hours") or "").strip()
-                    if not room_no:
-                        continue  # skip invalid rows
+            # read the whole file in one call rather than line by line through the text IO stack
+            with open(self.CSV_FILENAME, "rb") as f:
+                data = f.read()
+            reader = csv.reader(io.StringIO(data.decode("utf-8"), newline=""), skipinitialspace=True)
+            header = next(reader, None)
+            # If headers don't match, ignore file (defensive)
+            if header is None or any(h not in header for h in self.CSV_HEADERS):
+                print(f"Warning: CSV file found but headers don't match expected {self.CSV_HEADERS}. Skipping load.")
+                return
+            # map column positions once instead of building a dict per row
+            i_no, i_bld, i_cap, i_booked = (header.index(h) for h in self.CSV_HEADERS)
+            width = max(i_no, i_bld, i_cap, i_booked) + 1
+            hour_codes = self.HOUR_CODES
+            rooms = self.rooms
+            for row in reader:
+                if len(row) < width:
+                    row = row + [""] * (width - len(row))
+                room_no, building, capacity_str, booked_str = row[i_no], row[i_bld], row[i_cap], row[i_booked]
+                # save_to_csv never writes surrounding whitespace, so only strip when a hand-edited
+                # field actually starts or ends with it (skipinitialspace misses tabs and quoted blanks)
+                if room_no[:1].isspace() or room_no[-1:].isspace():
+                    room_no = room_no.strip()
+                if not room_no:
+                    continue  # skip invalid rows
+                if building[:1].isspace() or building[-1:].isspace():
+                    building = building.strip()
+                # canonical digits skip the exception machinery; anything else falls back to int(),
+                # which accepts surrounding whitespace, a sign and underscores
+                if capacity_str.isdecimal():
+                    capacity = int(capacity_str)
+                else:
                     try:
                         capacity = int(capacity_str)
                     except ValueError:
                         capacity = 0
-                    booked_hours = set()
-                    if booked_str:
-                        for piece in booked_str.split(";"):
-                            piece = piece.strip()
-                            if piece == "":
-                                continue
+                mask = 0
+                if booked_str:
+                    for piece in booked_str.split(";"):
+                        bit = hour_codes.get(piece)
+                        if bit is not None:
+                            mask |= bit
+                        elif piece:
+                            # non-canonical text such as " 5", "05" or "+5"
                             try:
                                 h = int(piece)
-                                if 0 <= h <= 23:
-                                    booked_hours.add(h)
                             except ValueError:
                                 continue
-                    room = Room(room_no=room_no, building=building, capacity=capacity, booked_hours=booked_hours)
-                    self.rooms[room_no] = room
+                            if 0 <= h <= 23:
+                                mask |= 1 << h
+                rooms[room_no] = Room(room_no=room_no, building=building, capacity=capacity, mask=mask)
+            # index the final dict once, so a duplicate room_no (later row wins) leaves no stale entry
+            for room_no, room in self.rooms.items():
+                room._manager = self
+                self._by_building.setdefault(room._building_lc, set()).add(room_no)
+            self._rebuild_sorted_indexes()
         except Exception as e:
             print(f"Error loading CSV file '{self.CSV_FILENAME}': {e}")
 
-    def save_to_csv(self):
-        """Save current rooms to CSV (overwrites file)."""
+    def save_to_csv(self) -> Optional[bool]:
+        """
+        Save current rooms to CSV (overwrites file). Skipped if the file exists and nothing changed
+        since load/last save. Returns True if the file was written, False if writing failed,
+        and None if the save was skipped.
+        """
+        if not self._dirty and os.path.exists(self.CSV_FILENAME):
+            return None
         try:
-            with open(self.CSV_FILENAME, "w", newline="", encoding="utf-8") as csvfile:
-                writer = csv.DictWriter(csvfile, fieldnames=self.CSV_HEADERS)
-                writer.writeheader()
-                for r in self.rooms.values():
-                    writer.writerow({
-                        "room_no": r.room_no,
-                        "building": r.building,
-                        "capacity": str(r.capacity),
-                        "booked_hours": r.booked_hours_str()
-                    })
+            rows = [(r.room_no, r.building, str(r.capacity), r.booked_hours_str()) for r in self.rooms.values()]
+            with open(self.CSV_FILENAME, "w", newline="", encoding="utf-8", buffering=1 << 20) as csvfile:
+                writer = csv.writer(csvfile)
+                writer.writerow(self.CSV_HEADERS)
+                writer.writerows(rows)
+            self._dirty.clear()
+            return True
         except Exception as e:
             print(f"Error saving to CSV file '{self.CSV_FILENAME}': {e}")
+            return False
 
     # CRUD-like operations
     def add_room(self, room_no: str, building: str, capacity: int):
@@ -144,9 +244,73 @@ class RoomManager:
         if room_no in self.rooms:
             raise RoomAlreadyExistsError(f"Room with room_no '{room_no}' already exists.")
         room = Room(room_no=room_no, building=building.strip(), capacity=int(capacity))
+        room._manager = self
         self.rooms[room_no] = room
+        self._by_building.setdefault(room._building_lc, set()).add(room_no)
+        self._soa_stale = True
+        bisect.insort(self._sorted_room_nos, room_no)
+        self._dirty.add(room_no)
         return room
 
+    def add_rooms(self, rooms: Iterable[Tuple[str, str, int]]) -> List[Room]:
+        """
+        Add many rooms given as (room_no, building, capacity) tuples.
+        All room_nos are validated up front, so either every room is added or none is;
+        raises RoomAlreadyExistsError on a clash with an existing room or within the batch.
+        """
+        new_rooms: Dict[str, Room] = {}
+        for room_no, building, capacity in rooms:
+            room_no = room_no.strip()
+            if room_no in self.rooms or room_no in new_rooms:
+                raise RoomAlreadyExistsError(f"Room with room_no '{room_no}' already exists.")
+            new_rooms[room_no] = Room(room_no=room_no, building=building.strip(), capacity=int(capacity))
+        self.rooms.update(new_rooms)
+        self._dirty.update(new_rooms)
+        for room_no, room in new_rooms.items():
+            room._manager = self
+            self._by_building.setdefault(room._building_lc, set()).add(room_no)
+        # re-sort once for the whole batch instead of an insort per room
+        self._rebuild_sorted_indexes()
+        return list(new_rooms.values())
+
+    def _rebuild_sorted_indexes(self):
+        """Recompute the room_no-ordered index from self.rooms and mark the capacity arrays stale."""
+        self._sorted_room_nos = sorted(self.rooms)
+        self._soa_stale = True
+
+    def _ensure_soa(self):
+        """Rebuild the capacity-ordered parallel arrays used by find_rooms if rooms were added."""
+        if not self._soa_stale:
+            return
+        rooms = sorted(self.rooms.values(), key=lambda rr: -rr.capacity)
+        self._soa_ids = [r.room_no for r in rooms]
+        self._soa_neg_caps = [-r.capacity for r in rooms]
+        self._soa_bld = [r._building_lc for r in rooms]
+        self._soa_masks = [r.mask for r in rooms]
+        self._soa_pos = {k: i for i, k in enumerate(self._soa_ids)}
+        self._soa_stale = False
+
+    def _booked(self, r: Room):
+        """Called by Room.book_hour: mark r dirty and refresh its mask in the arrays."""
+        self._dirty.add(r.room_no)
+        if not self._soa_stale:
+            self._soa_masks[self._soa_pos[r.room_no]] = r.mask
+
+    def _room_changed(self, r: Room, old_building_lc: str):
+        """
+        Called by the Room building/capacity setters: mark r dirty, move it to its new building set
+        and mark the capacity-ordered arrays stale (they hold copies of capacity and building).
+        """
+        self._dirty.add(r.room_no)
+        if r._building_lc != old_building_lc:
+            old_set = self._by_building.get(old_building_lc)
+            if old_set is not None:
+                old_set.discard(r.room_no)
+                if not old_set:
+                    del self._by_building[old_building_lc]
+            self._by_building.setdefault(r._building_lc, set()).add(r.room_no)
+        self._soa_stale = True
+
     def get_room(self, room_no: str) -> Room:
         """Return a Room by room_no or raise RoomNotFoundError."""
         room_no = room_no.strip()
@@ -160,6 +324,30 @@ class RoomManager:
         r.book_hour(hour)
         return r
 
+    def book_rooms(self, bookings: Iterable[Tuple[str, int]]) -> List[Room]:
+        """
+        Book many (room_no, hour) pairs. Pairs are grouped per room so each room is looked up once,
+        and every booking is checked before any is applied; raises RoomNotFoundError or
+        TimeslotAlreadyBookedError (including for the same slot repeated in the batch).
+        """
+        hours_by_room: Dict[str, List[int]] = {}
+        for room_no, hour in bookings:
+            hours_by_room.setdefault(room_no.strip(), []).append(hour)
+        pending = []
+        for room_no, hours in hours_by_room.items():
+            r = self.get_room(room_no)
+            seen = 0
+            for hour in hours:
+                bit = 1 << hour
+                if (r.mask | seen) & bit:
+                    raise TimeslotAlreadyBookedError(f"Room {room_no} is already booked at hour {hour}.")
+                seen |= bit
+            pending.append((r, hours))
+        for r, hours in pending:
+            for hour in hours:
+                r.book_hour(hour)
+        return [r for r, _ in pending]
+
     def find_rooms(self,
                    building: Optional[str] = None,
                    min_capacity: Optional[int] = None,
@@ -168,29 +356,76 @@ class RoomManager:
         Return list of rooms matching ALL provided criteria (criteria are ANDed).
         Passing None for a criterion skips it.
         """
-        results = []
-        for r in self.rooms.values():
-            if building is not None and r.building.lower() != building.lower():
-                continue
-            if min_capacity is not None and r.capacity < min_capacity:
-                continue
-            if free_at_hour is not None and not r.is_free_at(free_at_hour):
-                continue
-            results.append(r)
-        return results
+        return list(self.iter_rooms(building=building, min_capacity=min_capacity, free_at_hour=free_at_hour))
+
+    def iter_rooms(self,
+                   building: Optional[str] = None,
+                   min_capacity: Optional[int] = None,
+                   free_at_hour: Optional[int] = None) -> Iterator[Room]:
+        """
+        Lazily yield rooms matching ALL provided criteria, largest capacity first.
+        Use this instead of find_rooms when only a count or the first few matches are needed.
+        """
+        self._ensure_soa()
+        ids, blds, masks = self._soa_ids, self._soa_bld, self._soa_masks
+        # rooms are ordered largest-first, so min_capacity is a cutoff into the arrays
+        n = len(ids) if min_capacity is None else bisect.bisect_right(self._soa_neg_caps, -min_capacity)
+        bit = 1 << free_at_hour if free_at_hour is not None else 0
+        bld_lc = building.lower() if building is not None else None
+        positions = range(n)
+        if bld_lc is not None:
+            bld_nos = self._by_building.get(bld_lc, ())
+            if len(bld_nos) < n:
+                # the building is the more selective filter; visit only its rooms
+                pos = self._soa_pos
+                positions = sorted(i for i in (pos[k] for k in bld_nos) if i < n)
+        rooms = self.rooms
+        for i in positions:
+            if not masks[i] & bit and (bld_lc is None or blds[i] == bld_lc):
+                yield rooms[ids[i]]
 
     def list_rooms(self) -> List[Room]:
         """Return all rooms sorted by room_no."""
-        return sorted(self.rooms.values(), key=lambda rr: rr.room_no)
+        return [self.rooms[k] for k in self._sorted_room_nos]
 
 
 # ----------------------------
 # CLI Helpers
 # ----------------------------
+# When stdin is redirected from a regular file, all of it is read once and served from this iterator.
+_line_iter = None
+# Whether stdin is a regular file; decided on the first prompt and reused afterwards.
+_stdin_is_file: Optional[bool] = None
+
+
+def _stdin_is_regular_file() -> bool:
+    """True only for `< file` style input; ttys, pipes and sockets may be driven interactively."""
+    try:
+        return stat.S_ISREG(os.fstat(sys.stdin.fileno()).st_mode)
+    except (AttributeError, OSError, ValueError):
+        return False
+
+
+def read_line(prompt: str) -> str:
+    """input() replacement that reads a redirected input file in one go instead of line by line."""
+    global _line_iter, _stdin_is_file
+    if _line_iter is None:
+        if _stdin_is_file is None:
+            _stdin_is_file = _stdin_is_regular_file()
+        if not _stdin_is_file:
+            return input(prompt)
+        _line_iter = iter(sys.stdin.read().splitlines())
+    sys.stdout.write(prompt)
+    try:
+        return next(_line_iter)
+    except StopIteration:
+        raise EOFError from None
+
+
 def ask_non_empty(prompt: str) -> str:
     """Prompt until a non-empty response is given."""
     while True:
-        s = input(prompt).strip()
+        s = read_line(prompt).strip()
         if s:
             return s
         print("Input cannot be empty. Please try again.")
@@ -199,7 +434,7 @@ def ask_non_empty(prompt: str) -> str:
 def ask_int(prompt: str, min_value: Optional[int] = None, max_value: Optional[int] = None) -> int:
     """Prompt until a valid integer (and within optional bounds) is given."""
     while True:
-        s = input(prompt).strip()
+        s = read_line(prompt).strip()
         try:
             v = int(s)
             if (min_value is not None and v < min_value) or (max_value is not None and v > max_value):
@@ -224,15 +459,17 @@ def show_room_list(rooms: List[Room]):
     if not rooms:
         print("(no rooms found)")
         return
-    for r in rooms:
-        print(r)
+    # join and write in chunks instead of one print() per room
+    for i in range(0, len(rooms), 1000):
+        sys.stdout.write("\n".join(str(r) for r in rooms[i:i + 1000]) + "\n")
 
 
 # ----------------------------
 # Main Menu
 # ----------------------------
-def main_loop():
-    manager = RoomManager()
+def main_loop(manager: Optional[RoomManager] = None):
+    if manager is None:
+        manager = RoomManager()
     print("Welcome to the Room Booking CLI!")
     print(f"Loaded {len(manager.rooms)} room(s) from '{RoomManager.CSV_FILENAME}'.")
     print("Type the number for the desired action and press Enter.")
@@ -245,7 +482,7 @@ def main_loop():
         print("4) View bookings for a room")
         print("5) List all rooms")
         print("6) Exit (save state and quit)")
-        choice = input("Choose an option (1-6): ").strip()
+        choice = read_line("Choose an option (1-6): ").strip()
         if choice == "1":
             # Create room
             try:
@@ -276,9 +513,9 @@ def main_loop():
         elif choice == "3":
             # Find/filter rooms
             print("Enter search criteria. Leave blank to skip a criterion.")
-            bld = input("Building (exact match): ").strip()
+            bld = read_line("Building (exact match): ").strip()
             bld = bld if bld else None
-            cap_input = input("Minimum capacity (integer): ").strip()
+            cap_input = read_line("Minimum capacity (integer): ").strip()
             min_cap = None
             if cap_input:
                 try:
@@ -289,7 +526,7 @@ def main_loop():
                 except ValueError:
                     print("Invalid integer for capacity. Ignoring this criterion.")
                     min_cap = None
-            hour_input = input("Free at hour (0-23): ").strip()
+            hour_input = read_line("Free at hour (0-23): ").strip()
             free_at = None
             if hour_input:
                 try:
@@ -327,8 +564,13 @@ def main_loop():
         elif choice == "6":
             # Exit: save and quit
             print("Saving state to CSV and exiting...")
-            manager.save_to_csv()
-            print(f"Saved {len(manager.rooms)} room(s) to '{RoomManager.CSV_FILENAME}'. Goodbye!")
+            saved = manager.save_to_csv()
+            if saved:
+                print(f"Saved {len(manager.rooms)} room(s) to '{RoomManager.CSV_FILENAME}'. Goodbye!")
+            elif saved is None:
+                print(f"No changes since last save to '{RoomManager.CSV_FILENAME}'. Goodbye!")
+            else:
+                print("State was NOT saved. Exiting.")
             break
 
         else:
@@ -336,14 +578,20 @@ def main_loop():
 
 
 if __name__ == "__main__":
+    manager = RoomManager()
     try:
-        main_loop()
+        main_loop(manager)
     except KeyboardInterrupt:
         # catch Ctrl+C to save before exit
         print("\nKeyboardInterrupt detected. Saving state before exiting...")
         try:
-            RoomManager().save_to_csv()
-            print(f"Saved to {RoomManager.CSV_FILENAME}. Goodbye!")
+            saved = manager.save_to_csv()
+            if saved:
+                print(f"Saved to {RoomManager.CSV_FILENAME}. Goodbye!")
+            elif saved is None:
+                print(f"No changes since last save to {RoomManager.CSV_FILENAME}. Goodbye!")
+            else:
+                print("Error saving state. Exiting without saving.")
         except Exception:
             print("Error saving state. Exiting without saving.")
 
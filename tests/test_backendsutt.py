@@ -0,0 +1,179 @@
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from backendsutt import (  # noqa: E402
+    Room, RoomAlreadyExistsError, RoomManager, RoomNotFoundError, TimeslotAlreadyBookedError,
+)
+
+
+class TempDirTestCase(unittest.TestCase):
+    """Runs each test inside a fresh temporary directory, since CSV_FILENAME is relative."""
+
+    def setUp(self):
+        self._cwd = os.getcwd()
+        self._tmp = tempfile.TemporaryDirectory()
+        os.chdir(self._tmp.name)
+
+    def tearDown(self):
+        os.chdir(self._cwd)
+        self._tmp.cleanup()
+
+
+class LoadFromCsvTest(TempDirTestCase):
+    """load_from_csv against hand-edited (non-canonical) CSV files."""
+
+    def load(self, text: str) -> RoomManager:
+        with open(RoomManager.CSV_FILENAME, "w", newline="", encoding="utf-8") as f:
+            f.write(text)
+        return RoomManager()
+
+    def test_surrounding_whitespace_is_stripped(self):
+        m = self.load(
+            "room_no,building,capacity,booked_hours\r\n"
+            "\tA\t,\tNAB\t,5,\r\n"
+            "\" B \",\" LTC\",5,\r\n"
+            " \t,NAB,5,\r\n"
+        )
+        self.assertEqual(sorted(m.rooms), ["A", "B"])
+        self.assertEqual(m.get_room("A").building, "NAB")
+        self.assertEqual(m.get_room("B").building, "LTC")
+
+    def test_dirty_capacity_values(self):
+        m = self.load(
+            "room_no,building,capacity,booked_hours\r\n"
+            "A,NAB,\t10,\r\n"
+            "B,NAB,\" 10\",\r\n"
+            "C,NAB,1_000,\r\n"
+            "D,NAB,+4 ,\r\n"
+            "E,NAB,-3,\r\n"
+            "F,NAB,x,\r\n"
+            "G,NAB,,\r\n"
+        )
+        caps = {k: r.capacity for k, r in m.rooms.items()}
+        self.assertEqual(caps, {"A": 10, "B": 10, "C": 1000, "D": 4, "E": -3, "F": 0, "G": 0})
+
+    def test_dirty_hour_values(self):
+        m = self.load(
+            "room_no,building,capacity,booked_hours\r\n"
+            "A,NAB,5,1; 2;05;+6;-0;1_0;x;24;-1;;23 \r\n"
+        )
+        self.assertEqual(m.rooms["A"].booked_hours, {0, 1, 2, 5, 6, 10, 23})
+
+
+class BookingThroughRoomTest(TempDirTestCase):
+    """Bookings made on a Room directly must reach the manager's indexes and dirty set."""
+
+    def test_room_book_hour_updates_find_and_save(self):
+        m = RoomManager()
+        m.add_room("A", "NAB", 10)
+        m.save_to_csv()
+        self.assertEqual([r.room_no for r in m.find_rooms(free_at_hour=3)], ["A"])
+        m.get_room("A").book_hour(3)
+        self.assertEqual(m.find_rooms(free_at_hour=3), [])
+        self.assertTrue(m.save_to_csv())
+        # same bypass on a room that came from the CSV
+        loaded = RoomManager()
+        loaded.find_rooms()
+        loaded.get_room("A").book_hour(4)
+        self.assertEqual(loaded.find_rooms(free_at_hour=4), [])
+        loaded.save_to_csv()
+        self.assertEqual(RoomManager().get_room("A").booked_hours, {3, 4})
+
+    def test_room_attribute_change_updates_find_and_save(self):
+        m = RoomManager()
+        m.add_room("A", "NAB", 20)
+        m.add_room("B", "NAB", 5)
+        m.save_to_csv()
+        self.assertEqual([r.room_no for r in m.find_rooms(min_capacity=10)], ["A"])
+        r = m.get_room("A")
+        r.capacity = 1
+        r.building = "LTC"
+        self.assertEqual(m.find_rooms(min_capacity=10), [])
+        self.assertEqual([x.room_no for x in m.find_rooms(building="ltc")], ["A"])
+        self.assertEqual([x.room_no for x in m.find_rooms(building="nab")], ["B"])
+        self.assertTrue(m.save_to_csv())
+        reloaded = RoomManager().get_room("A")
+        self.assertEqual((reloaded.building, reloaded.capacity), ("LTC", 1))
+
+
+class BatchOperationsTest(TempDirTestCase):
+    """add_rooms/book_rooms are all-or-nothing: a rejected batch leaves rooms, masks and _dirty untouched."""
+
+    def setUp(self):
+        super().setUp()
+        self.m = RoomManager()
+        self.m.add_room("A", "NAB", 10)
+        self.m.book_room("A", 1)
+        self.m.save_to_csv()
+
+    def snapshot(self):
+        return sorted(self.m.rooms), {k: r.mask for k, r in self.m.rooms.items()}, set(self.m._dirty)
+
+    def assertRejected(self, exc, call, *args):
+        before = self.snapshot()
+        with self.assertRaises(exc):
+            call(*args)
+        self.assertEqual(self.snapshot(), before)
+
+    def test_add_rooms_duplicate_within_batch(self):
+        self.assertRejected(RoomAlreadyExistsError, self.m.add_rooms, [("B", "NAB", 5), ("B", "LTC", 6)])
+
+    def test_add_rooms_clash_with_existing_room(self):
+        self.assertRejected(RoomAlreadyExistsError, self.m.add_rooms, [("B", "NAB", 5), (" A ", "NAB", 6)])
+
+    def test_book_rooms_repeated_slot(self):
+        self.assertRejected(TimeslotAlreadyBookedError, self.m.book_rooms, [("A", 2), ("A", 3), ("A", 2)])
+
+    def test_book_rooms_already_booked_slot(self):
+        self.assertRejected(TimeslotAlreadyBookedError, self.m.book_rooms, [("A", 2), ("A", 1)])
+
+    def test_book_rooms_unknown_room(self):
+        self.assertRejected(RoomNotFoundError, self.m.book_rooms, [("A", 2), ("Z", 3)])
+
+    def test_successful_batches(self):
+        self.m.add_rooms([("B", "NAB", 5), ("C", "LTC", 30)])
+        self.m.book_rooms([("B", 4), ("C", 4), ("B", 5)])
+        self.assertEqual(self.m.get_room("B").booked_hours, {4, 5})
+        self.assertEqual(self.m._dirty, {"B", "C"})
+        self.assertEqual([r.room_no for r in self.m.find_rooms(building="nab", free_at_hour=4)], ["A"])
+
+
+class RoomAttributeTest(unittest.TestCase):
+
+    def test_setters_refresh_str(self):
+        r = Room("A", "NAB", 20, {3})
+        self.assertEqual(str(r), "Room: A | Building: NAB | Capacity: 20 | Booked hours: 3")
+        r.capacity = 1
+        r.building = "LTC"
+        self.assertEqual(str(r), "Room: A | Building: LTC | Capacity: 1 | Booked hours: 3")
+
+
+class SaveToCsvTest(TempDirTestCase):
+    def test_fresh_start_writes_header_only_file(self):
+        self.assertTrue(RoomManager().save_to_csv())
+        with open(RoomManager.CSV_FILENAME, encoding="utf-8") as f:
+            self.assertEqual(f.read().splitlines(), [",".join(RoomManager.CSV_HEADERS)])
+
+    def test_unchanged_existing_file_is_not_rewritten(self):
+        m = RoomManager()
+        m.add_room("A", "NAB", 10)
+        self.assertTrue(m.save_to_csv())
+        self.assertIsNone(m.save_to_csv())
+        self.assertIsNone(RoomManager().save_to_csv())
+
+    def test_failed_write_is_reported_as_false(self):
+        m = RoomManager()
+        m.add_room("A", "NAB", 10)
+        os.mkdir(RoomManager.CSV_FILENAME)
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.assertIs(m.save_to_csv(), False)
+
+
+if __name__ == "__main__":
+    unittest.main()